@@ -5,63 +5,175 @@ build_catalog.py — Scans public/books/ and rebuilds catalog.json
 Usage:
     python scripts/build_catalog.py --books_dir public/books
     python scripts/build_catalog.py --books_dir public/books --out catalog.json
+    python scripts/build_catalog.py --books_dir public/books --no-cache
+    python scripts/build_catalog.py --books_dir public/books --cache /tmp/cache.json
 
 Reads each <book-id>/book.json, extracts metadata, writes a unified catalog.json
-that the CatalogPage component loads at runtime.
+that the CatalogPage component loads at runtime. Entries are cached in
+scripts/.catalog-cache.json (outside public/, so it never ships with the site),
+keyed by book.json mtime and size, so unchanged books are not re-read on the
+next run.
 """
 
 import argparse
 import json
 import os
 import sys
+from operator import itemgetter
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+CACHE_FILENAME = ".catalog-cache.json"
+# Bump whenever the shape of a catalog entry changes so old caches are discarded
+CACHE_VERSION = 1
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), CACHE_FILENAME
+)
+
+REQUIRED_FIELDS = frozenset({"id", "title", "author"})
+_get_required = itemgetter("id", "title", "author")
 
 
 def load_book_meta(book_dir: str) -> dict | None:
     """Read book.json from a BookPack directory and return catalog entry."""
     book_json_path = os.path.join(book_dir, "book.json")
-    if not os.path.isfile(book_json_path):
+    try:
+        with open(book_json_path, "rb") as f:
+            meta = _loads(f.read())
+    except (FileNotFoundError, IsADirectoryError):
         print(f"  SKIP {os.path.basename(book_dir)}: no book.json", file=sys.stderr)
         return None
 
-    with open(book_json_path, "r", encoding="utf-8") as f:
-        meta = json.load(f)
-
     # Validate required fields
-    required = ["id", "title", "author"]
-    missing = [k for k in required if k not in meta]
+    # A non-object book.json (e.g. an array) has none of the required fields
+    if isinstance(meta, dict):
+        missing = REQUIRED_FIELDS.difference(meta.keys())
+    else:
+        missing = REQUIRED_FIELDS
     if missing:
         print(
-            f"  SKIP {os.path.basename(book_dir)}: book.json missing {missing}",
+            f"  SKIP {os.path.basename(book_dir)}: book.json missing {sorted(missing)}",
             file=sys.stderr,
         )
         return None
 
+    book_id, title, author = _get_required(meta)
     return {
-        "id": meta["id"],
-        "title": meta["title"],
-        "author": meta["author"],
+        "id": book_id,
+        "title": title,
+        "author": author,
         "coverImage": meta.get("coverImage"),
         "chapterCount": meta.get("chapterCount", 0),
         "characterCount": meta.get("characterCount", 0),
     }
 
 
-def build_catalog(books_dir: str) -> dict:
-    """Scan books_dir for BookPack folders and assemble catalog."""
-    books = []
-
+def load_cached_book_meta(book_dir: str, cache: dict) -> dict | None:
+    """Like load_book_meta, but reuse the cached entry if book.json is unchanged."""
+    name = os.path.basename(book_dir)
+    try:
+        st = os.stat(os.path.join(book_dir, "book.json"))
+    except OSError:
+        cache.pop(name, None)
+        return load_book_meta(book_dir)
+
+    key = [st.st_mtime_ns, st.st_size]
+    hit = cache.get(name)
+    # Anything but a well-formed entry for this exact key counts as a miss
+    if (
+        isinstance(hit, dict)
+        and hit.get("key") == key
+        and isinstance(hit.get("entry"), dict)
+    ):
+        return hit["entry"]
+
+    meta = load_book_meta(book_dir)
+    if meta is None:
+        cache.pop(name, None)
+    else:
+        cache[name] = {"key": key, "entry": meta}
+    return meta
+
+
+def load_cache(cache_path: str, books_dir: str) -> dict:
+    """Read the per-book catalog cache for books_dir.
+
+    Returns an empty cache if the file is missing or unreadable, or if it was
+    written by a different CACHE_VERSION or for a different books directory.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            cache = _loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(cache, dict)
+        or cache.get("version") != CACHE_VERSION
+        or cache.get("booksDir") != books_dir
+    ):
+        return {}
+    books = cache.get("books")
+    return books if isinstance(books, dict) else {}
+
+
+def save_cache(cache_path: str, books_dir: str, cache: dict):
+    """Write the per-book catalog cache, tagged with the books directory it covers.
+
+    The cache is only an optimisation, so a failed write warns instead of
+    failing the build. The file is replaced atomically so readers never see
+    a partial write.
+    """
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            payload = {"version": CACHE_VERSION, "booksDir": books_dir, "books": cache}
+            f.write(_dumps(payload) + b"\n")
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"WARNING: could not write cache {cache_path}: {e}", file=sys.stderr)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def build_catalog(books_dir: str, cache: dict | None = None) -> dict:
+    """Scan books_dir for BookPack folders and assemble catalog.
+
+    If cache is given it is consulted and updated in place; entries for
+    directories that no longer exist are dropped.
+    """
     if not os.path.isdir(books_dir):
         print(f"ERROR: books directory not found: {books_dir}", file=sys.stderr)
         sys.exit(1)
 
-    for entry in sorted(os.listdir(books_dir)):
-        book_path = os.path.join(books_dir, entry)
-        if not os.path.isdir(book_path):
-            continue
-        meta = load_book_meta(book_path)
-        if meta:
-            books.append(meta)
-            print(f"  OK   {meta['id']}: {meta['title']} by {meta['author']}")
+    with os.scandir(books_dir) as it:
+        entries = sorted(it, key=lambda e: e.name)
+
+    dirs = [e for e in entries if e.is_dir()]
+    if cache is None:
+        metas = (load_book_meta(e.path) for e in dirs)
+    else:
+        for stale in cache.keys() - {e.name for e in dirs}:
+            del cache[stale]
+        metas = (load_cached_book_meta(e.path, cache) for e in dirs)
+
+    books = [meta for meta in metas if meta is not None]
+    for meta in books:
+        print(f"  OK   {meta['id']}: {meta['title']} by {meta['author']}")
 
     return {"books": books}
 
@@ -80,6 +192,16 @@ def main():
         default=None,
         help="Output path for catalog.json (default: <books_dir>/../catalog.json)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-read every book.json and don't read or write the cache",
+    )
+    parser.add_argument(
+        "--cache",
+        default=DEFAULT_CACHE_PATH,
+        help=f"Path of the catalog cache (default: scripts/{CACHE_FILENAME})",
+    )
     args = parser.parse_args()
 
     books_dir = os.path.abspath(args.books_dir)
@@ -88,16 +210,21 @@ def main():
     else:
         out_path = os.path.join(os.path.dirname(books_dir), "catalog.json")
 
+    cache_path = os.path.abspath(args.cache)
+    cache = None if args.no_cache else load_cache(cache_path, books_dir)
+
     print(f"Scanning: {books_dir}")
-    catalog = build_catalog(books_dir)
+    catalog = build_catalog(books_dir, cache)
     print(f"\nFound {len(catalog['books'])} book(s)")
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(catalog, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    with open(out_path, "wb") as f:
+        f.write(_dumps(catalog) + b"\n")
 
     print(f"Wrote: {out_path}")
 
+    if cache is not None:
+        save_cache(cache_path, books_dir, cache)
+
 
 if __name__ == "__main__":
     main()
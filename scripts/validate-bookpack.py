@@ -15,15 +15,47 @@ import argparse
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    _loads = json.loads
+
+try:
+    import ijson
+
+    # The pure-Python backends are far slower than a full parse; don't stream on them
+    if ijson.backend not in ("yajl2_c", "yajl2_cffi"):
+        ijson = None
+except ImportError:  # optional; large snapshots are parsed whole without it
+    ijson = None
+
+SNAPSHOT_WORKERS = 8
+
+# Last snapshots bigger than this are streamed with ijson for the coverage check.
+# Streaming is ~2x slower than orjson but keeps peak memory ~10x lower, so it
+# only pays off for snapshots too big to comfortably hold as Python objects.
+STREAM_THRESHOLD = 64 << 20
+
+# Subdirectories indexed by _scan_tree; paths not found in the index are stat'ed
+TREE_DIRS = ("chapters", "characters")
+
+REQUIRED_BOOK_FIELDS = frozenset({"id", "title", "author", "schemaVersion"})
 
 
 class BookPackValidator:
     def __init__(self, book_dir: str, strict: bool = False):
         self.book_dir = os.path.abspath(book_dir)
         self.book_id = os.path.basename(self.book_dir)
+        self._prefix = self.book_dir + os.sep  # cheaper than os.path.join per file
         self.strict = strict  # treat warnings as errors
         self.errors: list[str] = []
         self.warnings: list[str] = []
+        self._json_cache: dict[str, dict | list | None] = {}
+        self._files: set[str] | None = None  # filled by _scan_tree
 
     def error(self, msg: str):
         self.errors.append(msg)
@@ -41,16 +73,69 @@ class BookPackValidator:
         print(f"  OK      {msg}")
 
     def load_json(self, rel_path: str) -> dict | list | None:
-        """Load a JSON file relative to book_dir. Returns None if missing/invalid."""
-        full = os.path.join(self.book_dir, rel_path)
-        if not os.path.isfile(full):
-            return None
+        """Load a JSON file relative to book_dir. Returns None if missing/invalid.
+
+        Results (including misses) are cached per validator, so each file is
+        read and parsed at most once no matter how many checks touch it.
+        """
+        if rel_path in self._json_cache:
+            return self._json_cache[rel_path]
+
+        return self._store_json(rel_path, *self._read_json(rel_path))
+
+    def _read_json(self, rel_path: str) -> tuple[dict | list | None, str | None]:
+        """Read and parse a file, returning (data, error message).
+
+        Touches no validator state, so it is safe to run in worker threads.
+        """
+        if not self._is_file(rel_path):
+            return None, None
         try:
-            with open(full, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(self._prefix + rel_path, "rb") as f:
+                return _loads(f.read()), None
+        except (FileNotFoundError, IsADirectoryError):
+            return None, None
         except (json.JSONDecodeError, UnicodeDecodeError) as e:
-            self.error(f"{rel_path}: invalid JSON — {e}")
-            return None
+            return None, f"{rel_path}: invalid JSON — {e}"
+
+    def _store_json(
+        self, rel_path: str, data: dict | list | None, err: str | None
+    ) -> dict | list | None:
+        """Cache a _read_json result and report its error, if any."""
+        if err:
+            self.error(err)
+        self._json_cache[rel_path] = data
+        return data
+
+    def _scan_tree(self):
+        """Record every file at the top level and under TREE_DIRS in one sweep."""
+        files = set()
+        stack = [("", self.book_dir)]
+        while stack:
+            prefix, path = stack.pop()
+            try:
+                with os.scandir(path) as it:
+                    for e in it:
+                        rel = prefix + e.name
+                        if e.is_file():
+                            files.add(rel)
+                        elif (
+                            e.is_dir(follow_symlinks=False)
+                            if prefix
+                            else e.is_dir() and e.name in TREE_DIRS
+                        ):
+                            stack.append((rel + "/", e.path))
+            except OSError:
+                continue
+        self._files = files
+
+    def _is_file(self, rel_path: str) -> bool:
+        """Check a path relative to book_dir, answering hits from the scanned tree."""
+        if self._files is not None and rel_path in self._files:
+            return True
+        # A miss is the rare error path; let the filesystem decide so that
+        # case-insensitive filesystems and unscanned dirs behave as before
+        return os.path.isfile(os.path.join(self.book_dir, rel_path))
 
     def validate(self) -> bool:
         """Run all validation checks. Returns True if no errors."""
@@ -62,8 +147,15 @@ class BookPackValidator:
             self.error(f"Directory does not exist: {self.book_dir}")
             return False
 
+        self._scan_tree()
+
         # 1. book.json
         book_meta = self._check_book_json()
+        if book_meta is None and not self.strict:
+            # Nothing downstream can pass without book.json; --strict still reports everything
+            print("-" * 60)
+            print("FAILED: book.json invalid, skipping further checks")
+            return False
 
         # 2. chapters/index.json
         chapter_index = self._check_chapters_index()
@@ -84,12 +176,9 @@ class BookPackValidator:
             self._check_character_count(book_meta, char_index)
 
         # 7. Node IDs exist in character registry
-        if chapter_index and char_index:
-            self._check_node_character_coverage(chapter_index, char_index)
-
         # 8. No empty snapshots
         if chapter_index:
-            self._check_no_empty_snapshots(chapter_index)
+            self._scan_snapshots(chapter_index, char_index)
 
         # Summary
         print("-" * 60)
@@ -109,10 +198,13 @@ class BookPackValidator:
             self.error("book.json is missing or invalid")
             return None
 
-        required = ["id", "title", "author", "schemaVersion"]
-        missing = [k for k in required if k not in meta]
+        # A non-object book.json (e.g. an array) has none of the required fields
+        if isinstance(meta, dict):
+            missing = REQUIRED_BOOK_FIELDS.difference(meta.keys())
+        else:
+            missing = REQUIRED_BOOK_FIELDS
         if missing:
-            self.error(f"book.json missing required fields: {missing}")
+            self.error(f"book.json missing required fields: {sorted(missing)}")
             return None
 
         if meta.get("schemaVersion") != "1.0":
@@ -123,8 +215,7 @@ class BookPackValidator:
         # Check cover image if referenced
         cover = meta.get("coverImage")
         if cover:
-            cover_path = os.path.join(self.book_dir, cover)
-            if not os.path.isfile(cover_path):
+            if not self._is_file(cover):
                 self.warn(f"book.json references coverImage '{cover}' but file not found")
 
         self.ok(f"book.json: {meta['title']} by {meta['author']}")
@@ -154,7 +245,6 @@ class BookPackValidator:
         return index
 
     def _check_chapter_files(self, index: list):
-        chapters_dir = os.path.join(self.book_dir, "chapters")
         missing_snapshots = []
         missing_deltas = []
 
@@ -163,9 +253,9 @@ class BookPackValidator:
             delta = entry.get("delta", "")
             ch = entry.get("chapter", "?")
 
-            if snap and not os.path.isfile(os.path.join(chapters_dir, snap)):
+            if snap and not self._is_file(f"chapters/{snap}"):
                 missing_snapshots.append((ch, snap))
-            if delta and not os.path.isfile(os.path.join(chapters_dir, delta)):
+            if delta and not self._is_file(f"chapters/{delta}"):
                 missing_deltas.append((ch, delta))
 
         if missing_snapshots:
@@ -219,24 +309,97 @@ class BookPackValidator:
         else:
             self.ok(f"characterCount matches: {actual}")
 
-    def _check_node_character_coverage(self, index: list, chars: dict):
+    def _scan_snapshots(self, index: list, chars: dict | None):
+        """Load every snapshot once, running the coverage and emptiness checks together."""
+        empty = []
+        last_nodes = None  # (node count, node IDs) of the last snapshot
+        last = len(index) - 1
+        entries = [
+            (i, entry.get("chapter", "?"), entry["snapshot"])
+            for i, entry in enumerate(index)
+            if entry.get("snapshot")
+        ]
+
+        # The last snapshot is cumulative and can be huge; stream just its node IDs
+        streamed = None
+        if ijson is not None and entries and entries[-1][0] == last:
+            rel = f"chapters/{entries[-1][2]}"
+            try:
+                big = os.path.getsize(self._prefix + rel) > STREAM_THRESHOLD
+            except OSError:
+                big = False
+            if big:
+                streamed = entries.pop()
+
+        # Snapshot reads are independent and mostly I/O, so fetch them in parallel;
+        # results are cached and errors reported here, in index order
+        rels = [f"chapters/{f}" for _, _, f in entries]
+        pending = [r for r in rels if r not in self._json_cache]
+        with ThreadPoolExecutor(max_workers=SNAPSHOT_WORKERS) as ex:
+            stream = streamed and ex.submit(
+                self._stream_node_ids, f"chapters/{streamed[2]}"
+            )
+            results = dict(zip(pending, ex.map(self._read_json, pending)))
+        snaps = [
+            self._store_json(r, *results[r]) if r in results else self._json_cache[r]
+            for r in rels
+        ]
+
+        for (i, ch, _), snap in zip(entries, snaps):
+            if not snap or not isinstance(snap, dict):
+                continue
+            nodes = snap.get("nodes", [])
+            if len(nodes) == 0:
+                empty.append(ch)
+            # Only the last snapshot is checked for coverage (it's cumulative)
+            if i == last:
+                last_nodes = (len(nodes), {node.get("id") for node in nodes})
+
+        if stream:
+            streamed_nodes, err = stream.result()
+            if err:
+                self.error(err)
+            if streamed_nodes:
+                count, node_ids, is_empty = streamed_nodes
+                if is_empty:
+                    empty.append(streamed[1])
+                last_nodes = (count, node_ids)
+
+        if chars and last_nodes is not None:
+            self._check_node_character_coverage(*last_nodes, chars)
+        self._check_no_empty_snapshots(empty)
+
+    def _stream_node_ids(
+        self, rel_path: str
+    ) -> tuple[tuple[int, set, bool] | None, str | None]:
+        """Stream (ID count, node IDs, no nodes?) out of a snapshot, plus any error.
+
+        ijson filters the "nodes.item.id" path in C, so node dicts are never
+        built. Like _read_json, this touches no validator state.
+        """
+        try:
+            with open(self._prefix + rel_path, "rb") as f:
+                # Non-object snapshots are skipped, as in the non-streamed path
+                head = f.read(64).lstrip()
+                if not head.startswith(b"{"):
+                    return None, None
+                f.seek(0)
+                ids = list(ijson.items(f, "nodes.item.id"))
+                is_empty = False
+                if not ids:
+                    f.seek(0)
+                    is_empty = next(ijson.items(f, "nodes.item"), None) is None
+        except OSError:
+            return None, None
+        except ijson.JSONError as e:
+            return None, f"{rel_path}: invalid JSON — {e}"
+        return (len(ids), set(ids), is_empty), None
+
+    def _check_node_character_coverage(self, count: int, node_ids: set, chars: dict):
         """Check that node IDs in the last snapshot exist in characters/index.json."""
-        # Only check the last snapshot (it's cumulative, so it has all nodes)
-        last_entry = index[-1]
-        snap_file = last_entry.get("snapshot", "")
-        if not snap_file:
-            return
-
-        snap = self.load_json(f"chapters/{snap_file}")
-        if not snap or not isinstance(snap, dict):
-            return
-
-        nodes = snap.get("nodes", [])
-        missing = []
-        for node in nodes:
-            nid = node.get("id", "")
-            if nid and nid not in chars:
-                missing.append(nid)
+        node_ids.discard("")
+        node_ids.discard(None)
+        missing = sorted(node_ids - chars.keys())
 
         if missing:
             self.warn(
@@ -245,22 +408,10 @@ class BookPackValidator:
                 + ("..." if len(missing) > 10 else "")
             )
         else:
-            self.ok(f"All {len(nodes)} node IDs found in characters/index.json")
+            self.ok(f"All {count} node IDs found in characters/index.json")
 
-    def _check_no_empty_snapshots(self, index: list):
+    def _check_no_empty_snapshots(self, empty: list):
         """Warn if any snapshot has 0 nodes."""
-        empty = []
-        for entry in index:
-            snap_file = entry.get("snapshot", "")
-            ch = entry.get("chapter", "?")
-            if not snap_file:
-                continue
-            snap = self.load_json(f"chapters/{snap_file}")
-            if snap and isinstance(snap, dict):
-                nodes = snap.get("nodes", [])
-                if len(nodes) == 0:
-                    empty.append(ch)
-
         if empty:
             self.warn(f"{len(empty)} snapshot(s) have 0 nodes: chapters {empty[:10]}")
         else: